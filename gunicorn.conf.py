@@ -0,0 +1,25 @@
+"""gunicorn settings for wsgi:application; override with environment variables."""
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('THREADS', 8))
+# Chat streams stay open for CHAT_STREAM_MAX_DURATION; gthread workers
+# heartbeat independently of requests, so this only catches hung workers.
+timeout = 60
+keepalive = 5
+# Recycle workers periodically to bound memory growth from the in-process caches.
+max_requests = 5000
+max_requests_jitter = 500
+# Import and set up the app once in the master, so a new worker (at startup,
+# when scaling out, or after max_requests) is a fork rather than a ~0.7s
+# import. Code changes then need a full restart, not a HUP.
+preload_app = True
+
+
+def post_fork(server, worker):
+    # Each worker needs its own database connections and scheduler thread.
+    from server import init_worker
+    init_worker()